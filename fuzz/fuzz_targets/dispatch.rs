@@ -0,0 +1,46 @@
+#![no_main]
+//! Single fuzz binary hosting every harness
+//!
+//! The harness to run is selected with the `FUZZ_SUBTARGET` environment
+//! variable, e.g. `FUZZ_SUBTARGET=pow_validation`. Building this one binary
+//! per sanitizer replaces building and linking one binary per target; see
+//! `--dispatch` in test_runner.py.
+
+use std::sync::OnceLock;
+
+/// Turns each harness body into `pub fn run(data: &[u8])` instead of a
+/// libFuzzer entry point (the harness modules are generated by build.rs)
+macro_rules! fuzz_target {
+    (|$data:ident: &[u8]| $body:block) => {
+        pub fn run($data: &[u8]) $body
+    };
+}
+
+mod harnesses {
+    include!(concat!(env!("OUT_DIR"), "/harnesses.rs"));
+}
+
+/// Harness selected by `FUZZ_SUBTARGET`, resolved once per process. An
+/// unknown name aborts, so the run is reported as a crash rather than a
+/// clean exit
+fn selected() -> fn(&[u8]) {
+    static SELECTED: OnceLock<fn(&[u8])> = OnceLock::new();
+    *SELECTED.get_or_init(|| {
+        let name = std::env::var("FUZZ_SUBTARGET").unwrap_or_default();
+        match harnesses::HARNESSES.iter().find(|(n, _)| *n == name) {
+            Some((_, run)) => *run,
+            None => {
+                let available: Vec<&str> = harnesses::HARNESSES.iter().map(|(n, _)| *n).collect();
+                eprintln!(
+                    "ERROR: unknown FUZZ_SUBTARGET {name:?}, expected one of: {}",
+                    available.join(", ")
+                );
+                std::process::abort();
+            }
+        }
+    })
+}
+
+libfuzzer_sys::fuzz_target!(|data: &[u8]| {
+    selected()(data);
+});
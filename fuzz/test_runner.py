@@ -9,13 +9,32 @@ Usage:
 """
 
 import argparse
+import asyncio
+import atexit
+import hashlib
+import json
 import logging
+import mmap
 import os
+import re
+import shutil
+import signal
 import subprocess
 import sys
+import tempfile
+import time
+from collections import deque
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Optional
+from types import MappingProxyType
+from typing import (
+    Callable, Deque, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set,
+    Tuple, Union,
+)
+
+try:
+    import blake3  # SIMD-parallel hashing, used for corpus dedup if present
+except ImportError:
+    blake3 = None
 
 # Set up logging
 logging.basicConfig(
@@ -23,102 +42,950 @@ logging.basicConfig(
     level=logging.INFO
 )
 
-def get_fuzz_targets() -> List[str]:
-    """Get list of all available fuzz targets."""
+FUZZ_DIR = Path(__file__).resolve().parent
+REPO_ROOT = FUZZ_DIR.parent
+
+# All available fuzz targets, in run order
+FUZZ_TARGETS: Tuple[str, ...] = (
+    "transaction_validation",
+    "block_validation",
+    "script_execution",
+    "segwit_validation",
+    "mempool_operations",
+    "utxo_commitments",
+    "compact_block_reconstruction",
+    "pow_validation",
+    "economic_validation",
+    "serialization",
+    "script_opcodes",
+    "differential_fuzzing",
+)
+_FUZZ_TARGET_SET: FrozenSet[str] = frozenset(FUZZ_TARGETS)
+
+# Targets that consume the same kind of input and can share a corpus
+# directory (corpus_dir/<group>/) with --shared-corpus
+CORPUS_GROUPS: Dict[str, List[str]] = {
+    "script": ["script_execution", "script_opcodes", "segwit_validation"],
+    "tx": ["transaction_validation", "mempool_operations"],
+}
+
+# Group names become directory names under corpus_dir
+GROUP_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+def parse_corpus_groups(specs: Sequence[str]) -> Dict[str, List[str]]:
+    """Parse `group=target,target,...` specs from the command line."""
+    groups = {}
+    for spec in specs:
+        group, sep, members = spec.partition("=")
+        if not sep or not group or not members:
+            raise ValueError(f"Expected GROUP=TARGET,..., got: {spec}")
+        if not GROUP_NAME_RE.fullmatch(group):
+            raise ValueError(
+                f"Invalid group name {group!r}: use letters, digits, _ or -"
+            )
+        if group in _FUZZ_TARGET_SET:
+            raise ValueError(
+                f"Group name {group!r} clashes with a target's corpus dir"
+            )
+        if group in groups:
+            raise ValueError(f"Group {group!r} is given more than once")
+        groups[group] = [t for t in members.split(",") if t]
+    return groups
+
+def corpus_names(groups: Dict[str, List[str]]) -> Dict[str, str]:
+    """Map each grouped target to the name of its shared corpus dir."""
+    names = {}
+    for group, members in groups.items():
+        for target in members:
+            if target not in _FUZZ_TARGET_SET:
+                raise ValueError(f"Unknown target in group {group}: {target}")
+            if target in names:
+                raise ValueError(
+                    f"{target} is in both {names[target]} and {group}"
+                )
+            names[target] = group
+    return names
+
+# Sanitizers fuzzed as separate builds for `--sanitizer all`; one binary
+# carrying every sanitizer is several times slower than any one of them
+SANITIZER_VARIANTS: Tuple[str, ...] = ("asan", "msan")
+
+# cargo-fuzz --sanitizer value per sanitizer. cargo-fuzz adds the matching
+# RUSTFLAGS itself, plus -Zbuild-std and origin tracking for memory. Rust
+# has no UndefinedBehaviorSanitizer, so ubsan builds without one.
+_CARGO_SANITIZERS: Dict[str, str] = {
+    "asan": "address",
+    "ubsan": "none",
+    "msan": "memory",
+}
+
+# Runtime environment overrides per sanitizer
+_SAN_ENVS: Dict[str, Dict[str, str]] = {
+    "asan": {
+        "ASAN_OPTIONS": "detect_leaks=1:detect_stack_use_after_return=1",
+    },
+    "msan": {
+        "MSAN_OPTIONS": "print_stats=1",
+    },
+}
+
+# Full child environments, built once at startup and shared read-only by
+# every build and run
+_BASE_ENV: Mapping[str, str] = MappingProxyType(dict(os.environ))
+_ENVS: Dict[Optional[str], Mapping[str, str]] = {
+    None: _BASE_ENV,
+    **{
+        sanitizer: MappingProxyType({**_BASE_ENV, **overrides})
+        for sanitizer, overrides in _SAN_ENVS.items()
+    },
+}
+
+def sanitizer_env(sanitizer: Optional[str]) -> Mapping[str, str]:
+    """Environment used to compile and run targets for a sanitizer."""
+    return _ENVS.get(sanitizer, _BASE_ENV)
+
+def target_env(
+    target: str,
+    binary: Path,
+    sanitizer: Optional[str]
+) -> Mapping[str, str]:
+    """Environment for running `target` from `binary`."""
+    env = sanitizer_env(sanitizer)
+    if binary.name == DISPATCH_TARGET:
+        return {**env, "FUZZ_SUBTARGET": target}
+    return env
+
+def spawn_and_wait(
+    argv: Sequence[str],
+    env: Optional[Mapping[str, str]],
+    stdout_fd: int,
+    stderr_fd: int
+) -> int:
+    """
+    Run a short-lived command to completion and return its exit code.
+    
+    Uses os.posix_spawn where available, which avoids duplicating the
+    runner's page tables the way fork+exec does. Only stdout/stderr are
+    passed through; every other descriptor Python opens is close-on-exec.
+    The child inherits the current directory, so commands must not depend
+    on it.
+    """
+    if env is None:
+        env = _BASE_ENV
+    if not hasattr(os, "posix_spawn"):
+        return subprocess.run(
+            argv, env=env, stdout=stdout_fd, stderr=stderr_fd
+        ).returncode
+    
+    path = shutil.which(argv[0], path=env.get("PATH"))
+    if path is None:
+        raise FileNotFoundError(f"Command not found: {argv[0]}")
+    file_actions = [
+        (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+        (os.POSIX_SPAWN_DUP2, stdout_fd, 1),
+        (os.POSIX_SPAWN_DUP2, stderr_fd, 2),
+    ]
+    pid = os.posix_spawn(path, list(argv), env, file_actions=file_actions)
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status)
+
+# Fuzz binary hosting every target, selected with FUZZ_SUBTARGET
+# (fuzz_targets/dispatch.rs)
+DISPATCH_TARGET = "dispatch"
+
+# Built binaries, keyed by (sanitizer, RUSTFLAGS, dispatch)
+_BUILD_CACHE: Dict[Tuple[Optional[str], str, bool], Dict[str, Path]] = {}
+
+def build_all_targets(
+    sanitizer: Optional[str] = None,
+    dispatch: bool = False
+) -> Dict[str, Path]:
+    """
+    Build every fuzz target with a single cargo invocation, or only the
+    dispatch binary if `dispatch` is set.
+    Returns a mapping of target name to built binary path.
+    """
+    env = sanitizer_env(sanitizer)
+    key = (sanitizer, env.get("RUSTFLAGS", ""), dispatch)
+    if key in _BUILD_CACHE:
+        return _BUILD_CACHE[key]
+
+    # Absolute fuzz and target dirs make the build independent of the
+    # caller's cwd, so it can be spawned directly
+    target_dir = FUZZ_DIR / "target"
+    build_cmd = [
+        "cargo", "+nightly", "fuzz", "build",
+        "--fuzz-dir", str(FUZZ_DIR),
+    ]
+    if sanitizer:
+        # Separate target dirs keep sanitizer variants from clobbering each
+        # other
+        target_dir = target_dir / sanitizer
+        build_cmd.extend(["--sanitizer", _CARGO_SANITIZERS[sanitizer]])
+    build_cmd.extend(["--target-dir", str(target_dir)])
+    if dispatch:
+        # Behind a feature so the default build does not compile every
+        # harness a second time; build.rs hosts exactly FUZZ_TARGETS
+        build_cmd.extend(["--features", DISPATCH_TARGET, DISPATCH_TARGET])
+        env = {**env, "FUZZ_DISPATCH_TARGETS": ",".join(FUZZ_TARGETS)}
+        logging.info(f"Building dispatch target ({sanitizer or 'default'})")
+    else:
+        logging.info(f"Building all fuzz targets ({sanitizer or 'default'})")
+    with tempfile.TemporaryFile() as out:
+        try:
+            returncode = spawn_and_wait(
+                build_cmd, env, out.fileno(), out.fileno()
+            )
+        except OSError as e:
+            raise RuntimeError(f"Build failed: {e}") from e
+        if returncode != 0:
+            out.seek(0)
+            raise RuntimeError(
+                f"Build failed: {out.read().decode(errors='replace')}"
+            )
+
+    binaries = {}
+    for target in (DISPATCH_TARGET,) if dispatch else FUZZ_TARGETS:
+        for candidate in sorted(target_dir.glob(f"*/release/{target}")):
+            if candidate.is_file():
+                binaries[target] = candidate
+                break
+    if dispatch:
+        # Every target runs from the same binary
+        binaries = (
+            {target: binaries[DISPATCH_TARGET] for target in FUZZ_TARGETS}
+            if DISPATCH_TARGET in binaries else {}
+        )
+
+    _BUILD_CACHE[key] = binaries
+    return binaries
+
+def core_slices(slots: int) -> List[List[int]]:
+    """
+    Split the CPUs available to this process into `slots` disjoint sets,
+    one per concurrently running target.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        cpus = sorted(os.sched_getaffinity(0))
+    else:
+        cpus = list(range(os.cpu_count() or 1))
+    if slots > len(cpus):
+        logging.warning(
+            f"Only {len(cpus)} CPU(s) available; running {len(cpus)} "
+            f"target(s) at a time instead of {slots}"
+        )
+    slots = max(1, min(slots, len(cpus)))
+    cores_per_target = max(1, len(cpus) // slots)
     return [
-        "transaction_validation",
-        "block_validation",
-        "script_execution",
-        "segwit_validation",
-        "mempool_operations",
-        "utxo_commitments",
-        "compact_block_reconstruction",
-        "pow_validation",
-        "economic_validation",
-        "serialization",
-        "script_opcodes",
-        "differential_fuzzing",
+        cpus[i * cores_per_target:(i + 1) * cores_per_target]
+        for i in range(slots)
     ]
 
-def run_fuzz_target(
+# libFuzzer's own guidance is to keep seeds small; larger inputs dominate
+# corpus load time
+LARGE_SEED_BYTES = 1000 * 1024
+
+# Directories already created by this run
+_ENSURED_DIRS: Set[Path] = set()
+
+def ensure_dir(path: Path) -> None:
+    """Create `path` (and parents) once; later calls skip the syscalls."""
+    if path not in _ENSURED_DIRS:
+        path.mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(path)
+
+def artifact_prefix(target: str, sanitizer: Optional[str] = None) -> str:
+    """
+    libFuzzer -artifact_prefix for a target's crash, leak and timeout
+    inputs: fuzz/artifacts/<target>[/<sanitizer>]/, as `cargo fuzz run` uses.
+    """
+    artifact_dir = FUZZ_DIR / "artifacts" / target
+    if sanitizer:
+        artifact_dir = artifact_dir / sanitizer
+    ensure_dir(artifact_dir)
+    return f"-artifact_prefix={artifact_dir}/"
+
+def seed_entries(target_dir: Path) -> List[os.DirEntry]:
+    """
+    Seed files in a corpus directory (empty if it does not exist).
+    scandir entries carry their file type, and cache stat() after its
+    first call.
+    """
+    try:
+        with os.scandir(target_dir) as it:
+            return [e for e in it if e.is_file()]
+    except FileNotFoundError:
+        return []
+
+def seed_order(entry: os.DirEntry) -> Tuple[int, str]:
+    """Sort key for keeping the smallest seed: size, then name."""
+    return entry.stat().st_size, entry.name
+
+def corpus_size(target_dir: Path) -> int:
+    """Total size in bytes of the seeds in a corpus directory."""
+    return sum(e.stat().st_size for e in seed_entries(target_dir))
+
+def seed_digest(path: Union[Path, str]) -> bytes:
+    """Content hash of a seed file (BLAKE3 if installed, else SHA-256)."""
+    hasher = blake3.blake3() if blake3 is not None else hashlib.sha256()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                hasher.update(m)
+    return hasher.digest()
+
+def dedupe_corpus(target_dir: Path) -> int:
+    """
+    Remove seeds with identical content, keeping the smallest file (by
+    size, then name) of each group.
+    Returns the number of files removed.
+    """
+    groups: Dict[bytes, List[os.DirEntry]] = {}
+    for seed in seed_entries(target_dir):
+        groups.setdefault(seed_digest(seed.path), []).append(seed)
+    
+    removed = 0
+    for seeds in groups.values():
+        if len(seeds) < 2:
+            continue
+        seeds.sort(key=seed_order)
+        for duplicate in seeds[1:]:
+            os.unlink(duplicate.path)
+            removed += 1
+    if removed:
+        logging.info(f"Removed {removed} duplicate seed(s) from {target_dir}")
+    return removed
+
+def scratch_root(requested: Optional[Path] = None) -> Path:
+    """
+    Create this run's private directory for corpus merge scratch space:
+    inside `requested` if given, else in /dev/shm (tmpfs), else in the
+    system temp dir. The caller removes it.
+    Raises OSError if `requested` is not usable.
+    """
+    if requested is not None:
+        requested.mkdir(parents=True, exist_ok=True)
+        return Path(tempfile.mkdtemp(prefix="fuzz-", dir=requested))
+    user = os.environ.get("USER") or str(os.getuid())
+    try:
+        return Path(tempfile.mkdtemp(prefix=f"fuzz-{user}-", dir="/dev/shm"))
+    except OSError:
+        logging.warning("/dev/shm not writable, using a temp dir")
+        return Path(tempfile.mkdtemp(prefix="fuzz-"))
+
+def minimize_corpus(
     target: str,
+    binary: Path,
     corpus_dir: Path,
-    max_time: Optional[int] = None,
-    max_runs: Optional[int] = None,
-    jobs: int = 1,
+    env: Optional[Mapping[str, str]] = None,
+    drop_large: bool = False,
+    scratch_dir: Optional[Path] = None,
     sanitizer: Optional[str] = None
-) -> tuple[bool, str]:
+) -> bool:
     """
-    Run a single fuzz target.
-    Returns (success, output).
+    Merge a target's corpus into a minimal set with the same coverage and
+    swap it in place of the original. The merge writes into `scratch_dir`
+    (ideally tmpfs) and only the surviving seeds are moved back.
+    Returns True if the corpus was replaced.
     """
     target_corpus = corpus_dir / target
-    target_corpus.mkdir(parents=True, exist_ok=True)
+    min_corpus = corpus_dir / f"{target}.min"
+    work_dir = scratch_dir or corpus_dir
+    merge_corpus = work_dir / f"{target}.min"
+    control_file = work_dir / f"{target}.merge_control"
+    if not target_corpus.is_dir():
+        return False
     
-    # Build fuzz target
-    logging.info(f"Building fuzz target: {target}")
-    build_cmd = ["cargo", "+nightly", "fuzz", "build", target]
+    if drop_large:
+        for seed in seed_entries(target_corpus):
+            if seed.stat().st_size > LARGE_SEED_BYTES:
+                logging.debug(f"Dropping large seed: {seed.path}")
+                os.unlink(seed.path)
     
-    if sanitizer:
-        env = os.environ.copy()
-        if sanitizer == "asan":
-            env["RUSTFLAGS"] = "-Zsanitizer=address"
-            env["ASAN_OPTIONS"] = "detect_leaks=1:detect_stack_use_after_return=1"
-        elif sanitizer == "ubsan":
-            env["RUSTFLAGS"] = "-Zsanitizer=undefined"
-            env["UBSAN_OPTIONS"] = "print_stacktrace=1:halt_on_error=1"
-        elif sanitizer == "all":
-            env["RUSTFLAGS"] = "-Zsanitizer=address -Zsanitizer=undefined"
-            env["ASAN_OPTIONS"] = "detect_leaks=1:detect_stack_use_after_return=1"
-            env["UBSAN_OPTIONS"] = "print_stacktrace=1:halt_on_error=1"
-    else:
-        env = os.environ.copy()
+    dedupe_corpus(target_corpus)
+    if not seed_entries(target_corpus):
+        return False
+    
+    logging.info(f"Minimizing corpus: {target}")
+    shutil.rmtree(merge_corpus, ignore_errors=True)
+    merge_corpus.mkdir(parents=True)
+    # A leftover control file would make libFuzzer resume a stale merge
+    control_file.unlink(missing_ok=True)
+    merge_cmd = [
+        str(binary),
+        "-merge=1",
+        "-use_value_profile=1",
+        f"-merge_control_file={control_file}",
+        artifact_prefix(target, sanitizer),
+        "-max_len=100000",
+        "-timeout=60",
+        str(merge_corpus),
+        str(target_corpus),
+    ]
     
     try:
-        subprocess.run(
-            build_cmd,
-            check=True,
-            capture_output=True,
-            env=env,
-            cwd=Path(__file__).parent.parent
-        )
-    except subprocess.CalledProcessError as e:
-        return False, f"Build failed: {e.stderr.decode()}"
+        with open(corpus_dir / f"{target}.merge.log", "wb") as log:
+            returncode = spawn_and_wait(
+                merge_cmd, env, log.fileno(), log.fileno()
+            )
+    except OSError as e:
+        returncode = None
+        logging.warning(f"Corpus minimization failed for {target}: {e}")
+    finally:
+        control_file.unlink(missing_ok=True)
+    if returncode != 0:
+        if returncode is not None:
+            logging.warning(
+                f"Corpus minimization failed for {target}: "
+                f"exit code {returncode}"
+            )
+        shutil.rmtree(merge_corpus, ignore_errors=True)
+        return False
+    
+    if not seed_entries(merge_corpus):
+        logging.warning(f"Corpus minimization produced no seeds for {target}")
+        merge_corpus.rmdir()
+        return False
+    
+    if merge_corpus != min_corpus:
+        # Stage the survivors next to the corpus so the swap is a rename
+        shutil.rmtree(min_corpus, ignore_errors=True)
+        min_corpus.mkdir(parents=True)
+        for seed in seed_entries(merge_corpus):
+            shutil.move(seed.path, min_corpus / seed.name)
+        shutil.rmtree(merge_corpus, ignore_errors=True)
+    
+    # Swap the minimized corpus in with renames so the original is never
+    # left half-replaced
+    old_corpus = corpus_dir / f"{target}.old"
+    shutil.rmtree(old_corpus, ignore_errors=True)
+    target_corpus.rename(old_corpus)
+    min_corpus.rename(target_corpus)
+    shutil.rmtree(old_corpus, ignore_errors=True)
+    return True
+
+# libFuzzer's -print_full_coverage=1 report: after a "FULL COVERAGE:"
+# header, a "U" line of uncovered and a "C" line of covered edges for each
+# function, listed in the same order on every run of a binary
+FULL_COVERAGE_RE = re.compile(rb"^([UC])((?:[ \t]+\S+)*)[ \t]*$", re.MULTILINE)
+
+# A seed's coverage signature: its covered (function index, edge) pairs
+Signature = FrozenSet[Tuple[int, bytes]]
+
+def parse_full_coverage(report: bytes) -> Signature:
+    """
+    Covered edges in a -print_full_coverage=1 report, as (function index,
+    edge) pairs. Edges are identified by the location libFuzzer prints
+    for them.
+    """
+    start = report.find(b"FULL COVERAGE:")
+    if start < 0:
+        return frozenset()
+    covered = set()
+    func = -1
+    for kind, edges in FULL_COVERAGE_RE.findall(report, start):
+        if kind == b"U":
+            func += 1
+        else:
+            covered.update((func, edge) for edge in edges.split())
+    return frozenset(covered)
+
+def seed_coverage(
+    binary: Path,
+    seed: Path,
+    env: Optional[Mapping[str, str]] = None,
+    prefix: Optional[str] = None
+) -> Optional[Signature]:
+    """
+    Execute a single seed and return its coverage signature: the set of
+    edges it covers.
+    Returns None if the seed could not be measured (e.g. it crashes).
+    """
+    # Given a file instead of a corpus dir, libFuzzer executes it once; it
+    # only records which PCs the file hit with -print_full_coverage=1
+    cov_cmd = [
+        str(binary),
+        "-print_full_coverage=1",
+    ]
+    if prefix:
+        cov_cmd.append(prefix)
+    cov_cmd.append(str(seed))
+    with tempfile.TemporaryFile() as out:
+        try:
+            returncode = spawn_and_wait(
+                cov_cmd, env, out.fileno(), out.fileno()
+            )
+        except OSError:
+            return None
+        if returncode != 0:
+            return None
+        out.seek(0)
+        report = out.read()
+    return parse_full_coverage(report) or None
+
+def select_seeds(
+    target: str,
+    binary: Path,
+    corpus_dir: Path,
+    keep: int,
+    env: Optional[Mapping[str, str]] = None,
+    sanitizer: Optional[str] = None
+) -> int:
+    """
+    Bucket a target's seeds by coverage signature and keep only the `keep`
+    smallest seeds of each bucket. Seeds whose coverage cannot be measured
+    are always kept.
+    Returns the number of seeds removed.
+    """
+    target_corpus = corpus_dir / target
+    if not target_corpus.is_dir():
+        return 0
+    
+    logging.info(f"Selecting seeds by coverage: {target}")
+    prefix = artifact_prefix(target, sanitizer)
+    buckets: Dict[Signature, List[os.DirEntry]] = {}
+    for seed in seed_entries(target_corpus):
+        signature = seed_coverage(binary, Path(seed.path), env, prefix)
+        if signature is not None:
+            buckets.setdefault(signature, []).append(seed)
+    
+    removed = 0
+    for seeds in buckets.values():
+        seeds.sort(key=seed_order)
+        for redundant in seeds[keep:]:
+            os.unlink(redundant.path)
+            removed += 1
+    logging.info(
+        f"Kept {len(buckets)} coverage signature(s) for {target}, "
+        f"removed {removed} seed(s)"
+    )
+    return removed
+
+# Only the end of a fuzzer log is scanned, so memory use does not grow
+# with run duration
+LOG_TAIL_BYTES = 64 * 1024
+CRASH_RE = re.compile(rb"(ERROR: |==\d+==ERROR|libFuzzer: (crash|deadly))")
+
+def read_log_tail(log_path: Path, size: int = LOG_TAIL_BYTES) -> bytes:
+    """Return the last `size` bytes of a log file."""
+    with open(log_path, "rb") as f:
+        length = os.fstat(f.fileno()).st_size
+        if length == 0:
+            return b""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+            return m[max(0, length - size):]
+
+def run_label(target: str, sanitizer: Optional[str]) -> str:
+    """Name of a (target, sanitizer) run for logs and the summary."""
+    return f"{target} ({sanitizer})" if sanitizer else target
+
+def fuzz_command(
+    target: str,
+    binary: Path,
+    corpus_dir: Path,
+    max_time: Optional[int] = None,
+    max_runs: Optional[int] = None,
+    jobs: int = 1,
+    sanitizer: Optional[str] = None,
+    corpus_name: Optional[str] = None
+) -> Tuple[List[str], Mapping[str, str], Path]:
+    """
+    Prepare a fuzz run: returns (argv, env, log path).
+    The corpus is <corpus_dir>/<corpus_name>, defaulting to the target name.
+    Output goes to <corpus_dir>/<target>[.<sanitizer>].log.
+    """
+    shared = corpus_name is not None and corpus_name != target
+    target_corpus = corpus_dir / (corpus_name or target)
+    ensure_dir(target_corpus)
+    env = target_env(target, binary, sanitizer)
     
-    # Run fuzz target
-    logging.info(f"Running fuzz target: {target}")
+    # Run the binary directly; `cargo fuzz run` would re-check the build
     run_cmd = [
-        "cargo", "+nightly", "fuzz", "run", target,
+        str(binary),
         str(target_corpus),
-        "--",
+        artifact_prefix(target, sanitizer),
         "-max_len=100000",
         "-timeout=60",
     ]
     
     if max_time:
-        run_cmd.extend(["-max_total_time", str(max_time)])
+        run_cmd.append(f"-max_total_time={max_time}")
     if max_runs:
-        run_cmd.extend(["-runs", str(max_runs)])
+        run_cmd.append(f"-runs={max_runs}")
     if jobs > 1:
-        run_cmd.extend(["-jobs", str(jobs)])
+        # Fork mode shares and merges the corpus across children; -reload
+        # picks up seeds written by other processes using the same dir
+        run_cmd.extend([f"-fork={jobs}", "-ignore_crashes=0", "-reload=30"])
+    elif shared:
+        # Pick up seeds found by sibling targets in the shared dir
+        run_cmd.append("-reload=30")
+    
+    log_name = f"{target}.{sanitizer}.log" if sanitizer else f"{target}.log"
+    return run_cmd, env, corpus_dir / log_name
+
+def pin_to(cpus: Optional[Sequence[int]]) -> Optional[Callable[[], None]]:
+    """preexec_fn that pins the child to `cpus`, where supported."""
+    if cpus and hasattr(os, "sched_setaffinity"):
+        return lambda: os.sched_setaffinity(0, set(cpus))
+    return None
+
+# Artifacts libFuzzer reports writing for a crashing input
+CRASH_ARTIFACT_RE = re.compile(rb"Test unit written to (\S*(?:crash|leak)-\S+)")
+
+def run_record(
+    target: str,
+    sanitizer: Optional[str],
+    log_path: Optional[Path],
+    ok: bool,
+    reason: Optional[str] = None,
+    tail: Optional[bytes] = None
+) -> Dict[str, object]:
+    """
+    Summary of a finished run, as written to the results log. Only this
+    small record is kept; the full output stays in the log file.
+    """
+    if tail is None:
+        try:
+            tail = read_log_tail(log_path) if log_path else b""
+        except OSError:
+            tail = b""
+    rates = EXEC_RATE_RE.findall(tail)
+    return {
+        "target": target,
+        "sanitizer": sanitizer,
+        "ok": ok,
+        "crashes": len(set(CRASH_ARTIFACT_RE.findall(tail))),
+        "exec_s": int(rates[-1]) if rates else None,
+        "log": str(log_path) if log_path else None,
+        "reason": reason,
+    }
+
+def fuzz_result(
+    target: str,
+    sanitizer: Optional[str],
+    returncode: int,
+    log_path: Path
+) -> Dict[str, object]:
+    """Classify a finished run from its exit code and log tail."""
+    tail = read_log_tail(log_path)
+    ok = returncode == 0 or not CRASH_RE.search(tail)
+    reason = None if ok else f"exit code {returncode}"
+    return run_record(target, sanitizer, log_path, ok, reason, tail)
+
+def append_record(results_path: Path, record: Dict[str, object]) -> None:
+    """Append one run record to the JSONL results log."""
+    with open(results_path, "a") as f:
+        f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+# Watchdog: the run is polled every POLL_INTERVAL seconds and its log is
+# probed for progress every PROBE_INTERVAL seconds
+POLL_INTERVAL = 5
+PROBE_INTERVAL = 30
+STALL_SAMPLES = 10
+# libFuzzer status lines ("#N NEW cov: ... exec/s: R", fork mode "#N: cov:
+# ... exec/s R"); the INITED line is skipped since it reports 0 by design.
+# R is a cumulative average, so it is only reported, not used to detect
+# stalls.
+EXEC_RATE_RE = re.compile(
+    rb"#\d+:?\s+(?:(?:pulse|NEW|REDUCE)\s+)?cov:.*?exec/s:?\s*(\d+)"
+)
+
+# Run counter of any status line, and the ":" that marks fork mode
+RUN_COUNTER_RE = re.compile(
+    rb"^#(\d+)(:?)\s+(?:\w+\s+)?cov:", re.MULTILINE
+)
+
+# Coverage counter of any status line, including INITED
+COVERAGE_RE = re.compile(rb"#\d+:?\s+(?:\w+\s+)?cov:\s*(\d+)")
+
+# Early-stop reasons reported by ProgressMonitor
+STALLED = "stalled"
+PLATEAU = "plateau"
+
+class ProgressMonitor:
+    """
+    Tracks a running fuzzer's progress from its log and decides when it
+    should be stopped early: as STALLED (a failure) when exec/s stays below
+    `stall_threshold`, or as PLATEAU (a success) when coverage grew by less
+    than `plateau_delta` over the last `plateau_window` seconds.
+    A zero threshold or window disables that check.
+    """
+    
+    def __init__(
+        self,
+        log_path: Path,
+        stall_threshold: float = 0,
+        plateau_window: float = 0,
+        plateau_delta: int = 1
+    ):
+        self.log_path = log_path
+        self.stall_threshold = stall_threshold
+        self.plateau_window = plateau_window
+        self.plateau_delta = plateau_delta
+        self.rates: Deque[float] = deque(maxlen=STALL_SAMPLES)
+        # (time, run counter) of the previous probe, and the time the run
+        # counter last changed
+        self.last_runs: Optional[Tuple[float, int]] = None
+        self.runs_changed_at = 0.0
+        self.coverage: Deque[Tuple[float, int]] = deque()
+    
+    def probe(self) -> Optional[str]:
+        """
+        Sample the log tail. Returns STALLED once the moving average of
+        exec/s over the last STALL_SAMPLES probes is below the threshold
+        (each probe's rate is the run counter's growth since the previous
+        probe, so a log with no new status line counts as 0 exec/s),
+        PLATEAU once coverage has stopped growing, otherwise None.
+        """
+        if self.stall_threshold <= 0 and self.plateau_window <= 0:
+            return None
+        tail = read_log_tail(self.log_path)
+        if self.stall_threshold > 0 and self._stalled(tail):
+            return STALLED
+        if self.plateau_window > 0 and self._plateaued(tail):
+            return PLATEAU
+        return None
     
+    def _stalled(self, tail: bytes) -> bool:
+        counters = RUN_COUNTER_RE.findall(tail)
+        if not counters:
+            # Still loading the corpus
+            return False
+        runs, fork_mode = int(counters[-1][0]), bool(counters[-1][1])
+        now = time.monotonic()
+        if self.last_runs is None:
+            self.last_runs = (now, runs)
+            self.runs_changed_at = now
+            return False
+        last_time, last_count = self.last_runs
+        self.last_runs = (now, runs)
+        self.rates.append(max(0, runs - last_count) / (now - last_time))
+        if runs != last_count:
+            self.runs_changed_at = now
+        if (
+            len(self.rates) < self.rates.maxlen
+            or sum(self.rates) / len(self.rates) >= self.stall_threshold
+        ):
+            return False
+        if runs == last_count and not fork_mode:
+            # A single process only prints pulse lines at power-of-two run
+            # counts; a silent log is not a stall until a fuzzer running at
+            # the threshold would have reached the next one
+            next_pulse = 1 << runs.bit_length()
+            silence = now - self.runs_changed_at
+            return silence >= (next_pulse - runs) / self.stall_threshold
+        return True
+    
+    def _plateaued(self, tail: bytes) -> bool:
+        covs = COVERAGE_RE.findall(tail)
+        if not covs:
+            return False
+        now = time.monotonic()
+        self.coverage.append((now, int(covs[-1])))
+        # Keep exactly one sample at or before the start of the window
+        window_start = now - self.plateau_window
+        while len(self.coverage) > 1 and self.coverage[1][0] <= window_start:
+            self.coverage.popleft()
+        if self.coverage[0][0] > window_start:
+            return False
+        values = [cov for _, cov in self.coverage]
+        return max(values) - min(values) < self.plateau_delta
+
+def signal_group(proc: asyncio.subprocess.Process, sig: int) -> None:
+    """Signal a fuzzer and its fork-mode children (its process group)."""
     try:
-        result = subprocess.run(
-            run_cmd,
-            capture_output=True,
-            text=True,
-            env=env,
-            cwd=Path(__file__).parent.parent,
-            timeout=max_time + 60 if max_time else None
-        )
-        
-        output = result.stdout + result.stderr
-        success = result.returncode == 0 or "crash" not in output.lower()
-        return success, output
-    except subprocess.TimeoutExpired:
-        return True, "Fuzzing completed (timeout)"
+        os.killpg(proc.pid, sig)
+    except ProcessLookupError:
+        pass
+
+async def stop_process(
+    proc: asyncio.subprocess.Process,
+    grace: int = 10
+) -> None:
+    """Terminate a fuzzer, giving it `grace` seconds to exit cleanly."""
+    signal_group(proc, signal.SIGTERM)
+    try:
+        await asyncio.wait_for(proc.wait(), timeout=grace)
+    except asyncio.TimeoutError:
+        signal_group(proc, signal.SIGKILL)
+        await proc.wait()
+
+def run_fuzz_target(
+    target: str,
+    binary: Path,
+    corpus_dir: Path,
+    max_time: Optional[int] = None,
+    max_runs: Optional[int] = None,
+    jobs: int = 1,
+    sanitizer: Optional[str] = None,
+    cpus: Optional[Sequence[int]] = None,
+    corpus_name: Optional[str] = None,
+    stall_threshold: float = 0,
+    plateau_window: float = 0,
+    plateau_delta: int = 1
+) -> Dict[str, object]:
+    """
+    Run a single, already built fuzz target, optionally pinned to `cpus`.
+    The run may be stopped early by a ProgressMonitor: as failed once its
+    exec/s stays below `stall_threshold`, or as successful once its
+    coverage plateaus over `plateau_window` seconds.
+    Returns the run's record (see run_record()).
+    """
+    return asyncio.run(run_fuzz_target_async(
+        target, binary, corpus_dir, max_time, max_runs, jobs, sanitizer,
+        cpus, corpus_name, stall_threshold, plateau_window, plateau_delta
+    ))
+
+async def run_fuzz_target_async(
+    target: str,
+    binary: Path,
+    corpus_dir: Path,
+    max_time: Optional[int] = None,
+    max_runs: Optional[int] = None,
+    jobs: int = 1,
+    sanitizer: Optional[str] = None,
+    cpus: Optional[Sequence[int]] = None,
+    corpus_name: Optional[str] = None,
+    stall_threshold: float = 0,
+    plateau_window: float = 0,
+    plateau_delta: int = 1
+) -> Dict[str, object]:
+    """Coroutine behind run_fuzz_target(), run concurrently by run_all()."""
+    run_cmd, env, log_path = fuzz_command(
+        target, binary, corpus_dir, max_time, max_runs, jobs, sanitizer,
+        corpus_name
+    )
+    logging.info(f"Running fuzz target: {run_label(target, sanitizer)}")
+    
+    proc = None
+    try:
+        with open(log_path, "wb") as log:
+            # A session of its own makes the fuzzer the leader of a process
+            # group that also holds its -fork children
+            proc = await asyncio.create_subprocess_exec(
+                *run_cmd,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=env,
+                cwd=REPO_ROOT,
+                preexec_fn=pin_to(cpus),
+                start_new_session=True
+            )
+            monitor = ProgressMonitor(
+                log_path, stall_threshold, plateau_window, plateau_delta
+            )
+            start = time.monotonic()
+            next_probe = start + PROBE_INTERVAL
+            waiter = asyncio.ensure_future(proc.wait())
+            while True:
+                done, _ = await asyncio.wait({waiter}, timeout=POLL_INTERVAL)
+                if done:
+                    returncode = waiter.result()
+                    break
+                now = time.monotonic()
+                if max_time and now - start > max_time + 60:
+                    signal_group(proc, signal.SIGKILL)
+                    await proc.wait()
+                    return run_record(
+                        target, sanitizer, log_path, True, "timeout"
+                    )
+                if now >= next_probe:
+                    next_probe = now + PROBE_INTERVAL
+                    reason = monitor.probe()
+                    if reason:
+                        report = (
+                            logging.info if reason == PLATEAU
+                            else logging.warning
+                        )
+                        report(f"{target}: {reason}, stopping")
+                        await stop_process(proc)
+                        return run_record(
+                            target, sanitizer, log_path, reason == PLATEAU,
+                            reason
+                        )
     except Exception as e:
-        return False, f"Error running fuzzer: {e}"
+        return run_record(
+            target, sanitizer, log_path, False, f"Error running fuzzer: {e}"
+        )
+    finally:
+        # Never leave a fuzzer running, whatever ended the watch loop
+        if proc is not None and proc.returncode is None:
+            await stop_process(proc)
+    
+    return fuzz_result(target, sanitizer, returncode, log_path)
+
+def report_result(record: Dict[str, object]) -> None:
+    """Log the outcome of a single run."""
+    label = run_label(record["target"], record["sanitizer"])
+    if record["ok"]:
+        logging.info(f"✓ {label}: Completed successfully")
+        return
+    logging.error(f"✗ {label}: Failed ({record['reason']})")
+    if record["log"]:
+        try:
+            tail = read_log_tail(Path(record["log"]), 500)  # Last 500 bytes
+        except OSError:
+            return
+        logging.error(tail.decode(errors="replace"))
+
+async def run_all(
+    runs: Sequence[Tuple[str, Optional[str]]],
+    binaries: Dict[Optional[str], Dict[str, Path]],
+    corpus_dir: Path,
+    max_time: Optional[int],
+    max_runs: Optional[int],
+    jobs: int,
+    results_path: Path,
+    shared: Optional[Dict[str, str]] = None,
+    stall_threshold: float = 0,
+    plateau_window: float = 0,
+    plateau_delta: int = 1
+) -> None:
+    """
+    Run every (target, sanitizer) pair concurrently from one event loop,
+    at most `jobs` at a time, each pinned to its own set of cores.
+    Each run's record is appended to `results_path` as it finishes.
+    Runs with the largest corpus start first (longest processing time
+    first), so a slow target does not start last and extend the makespan.
+    """
+    shared = shared or {}
+    sizes = {
+        name: corpus_size(corpus_dir / name)
+        for name in {shared.get(t, t) for t, _ in runs}
+    }
+    runs = sorted(runs, key=lambda r: sizes[shared.get(r[0], r[0])], reverse=True)
+    slices = core_slices(max(1, min(jobs, len(runs))))
+    sem = asyncio.Semaphore(len(slices))
+    
+    async def one(target: str, sanitizer: Optional[str]) -> None:
+        async with sem:
+            # Every holder of the semaphore owns exactly one slice
+            cpus = slices.pop()
+            try:
+                record = await run_fuzz_target_async(
+                    target,
+                    binaries[sanitizer][target],
+                    corpus_dir,
+                    max_time,
+                    max_runs,
+                    len(cpus),
+                    sanitizer,
+                    cpus,
+                    shared.get(target),
+                    stall_threshold,
+                    plateau_window,
+                    plateau_delta
+                )
+            except Exception as e:
+                record = run_record(
+                    target, sanitizer, None, False, f"Exception - {e}"
+                )
+            finally:
+                slices.append(cpus)
+        append_record(results_path, record)
+        report_result(record)
+    
+    await asyncio.gather(*(one(t, s) for t, s in runs))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -135,8 +1002,24 @@ Examples:
   # Run with sanitizers (24 hours)
   python3 test_runner.py corpus/ --sanitizer asan --max-time 86400
   
-  # Run once through corpus (for CI)
+  # Same, but stop a target once it finds no new coverage for 30 minutes
+  python3 test_runner.py corpus/ --sanitizer asan --max-time 86400 --plateau-window 1800
+  
+  # Build one binary per sanitizer instead of one per target
+  python3 test_runner.py corpus/ --sanitizer all --dispatch
+  
+  # Run once through corpus (for CI, minimizes the corpus first)
   python3 test_runner.py corpus/ --max-runs 1
+  
+  # Minimize the corpus before fuzzing, dropping seeds over 1000KB
+  python3 test_runner.py corpus/ --minimize --drop-large
+  
+  # Keep the smallest seed for each distinct coverage signature
+  python3 test_runner.py corpus/ --select-seeds 1 --max-runs 1
+  
+  # Share one corpus between the script-consuming targets
+  python3 test_runner.py corpus/ --parallel --shared-corpus
+  python3 test_runner.py corpus/ --corpus-group script=script_execution,script_opcodes
         """
     )
     
@@ -169,13 +1052,16 @@ Examples:
         "-j",
         type=int,
         default=1,
-        help="Number of parallel jobs (default: 1)"
+        help="Number of parallel jobs (default: 1; with --parallel, at most "
+             "one concurrent target per available CPU)"
     )
     
     parser.add_argument(
         "--sanitizer",
         choices=["asan", "ubsan", "msan", "all"],
-        help="Sanitizer to use (address, undefined, memory, or all)"
+        help="Sanitizer to use (address, memory, or all; 'all' fuzzes asan "
+             "and msan as separate builds, splitting --max-time). Rust has no "
+             "UBSan, so ubsan builds without a sanitizer"
     )
     
     parser.add_argument(
@@ -184,6 +1070,94 @@ Examples:
         help="Run multiple targets in parallel"
     )
     
+    parser.add_argument(
+        "--dispatch",
+        action="store_true",
+        help="Build only the dispatch binary (one per sanitizer) and select "
+             "each target with FUZZ_SUBTARGET"
+    )
+    
+    parser.add_argument(
+        "--minimize",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Merge each corpus to a minimal set before fuzzing "
+             "(default: on with --max-runs 1)"
+    )
+    
+    parser.add_argument(
+        "--drop-large",
+        action="store_true",
+        help="Delete seeds larger than 1000KB before minimizing"
+    )
+    
+    parser.add_argument(
+        "--scratch-dir",
+        type=Path,
+        help="Directory to create this run's corpus minimization scratch "
+             "space in (default: /dev/shm, else the system temp dir)"
+    )
+    
+    parser.add_argument(
+        "--select-seeds",
+        type=int,
+        metavar="K",
+        help="Before fuzzing, keep only the K smallest seeds for each "
+             "distinct per-seed coverage signature"
+    )
+    
+    parser.add_argument(
+        "--shared-corpus",
+        action="store_true",
+        help="Let related targets share corpus_dir/<group>/ and reload each "
+             "other's seeds (default groups: "
+             + "; ".join(f"{g}={','.join(t)}" for g, t in CORPUS_GROUPS.items())
+             + ")"
+    )
+    
+    parser.add_argument(
+        "--corpus-group",
+        action="append",
+        default=[],
+        metavar="GROUP=TARGET,...",
+        help="Shared corpus group to use instead of the defaults; may be "
+             "repeated (implies --shared-corpus)"
+    )
+    
+    parser.add_argument(
+        "--stall-threshold",
+        type=float,
+        default=1,
+        metavar="EXEC_S",
+        help="Stop a run as stalled when its exec/s averages below this over "
+             f"{STALL_SAMPLES * PROBE_INTERVAL // 60} minutes "
+             "(default: 1, 0 disables)"
+    )
+    
+    parser.add_argument(
+        "--plateau-window",
+        type=int,
+        default=0,
+        metavar="SECONDS",
+        help="Stop a run early once its coverage grew by less than "
+             "--plateau-delta over this many seconds (default: 0, disabled)"
+    )
+    
+    parser.add_argument(
+        "--plateau-delta",
+        type=int,
+        default=1,
+        metavar="EDGES",
+        help="Minimum coverage growth per --plateau-window (default: 1)"
+    )
+    
+    parser.add_argument(
+        "--results",
+        type=Path,
+        help="JSONL file for per-run results (default: "
+             "<corpus_dir>/results.jsonl)"
+    )
+    
     parser.add_argument(
         "--loglevel",
         default="INFO",
@@ -191,86 +1165,172 @@ Examples:
         help="Log level"
     )
     
-    args = parser.parse_args()
+    args = parser.parse_intermixed_args()
+    
+    # Children run from the repo root, so resolve paths against the
+    # caller's cwd up front
+    args.corpus_dir = args.corpus_dir.resolve()
+    if args.scratch_dir:
+        args.scratch_dir = args.scratch_dir.resolve()
+    if args.results:
+        args.results = args.results.resolve()
     
     logging.getLogger().setLevel(getattr(logging, args.loglevel))
     
-    # Determine targets
-    if args.targets:
-        targets = args.targets
-    else:
-        targets = get_fuzz_targets()
+    if args.minimize is None:
+        args.minimize = args.max_runs == 1
+    if args.select_seeds is not None and args.select_seeds < 1:
+        parser.error("--select-seeds must be at least 1")
     
-    # Validate targets
-    available_targets = get_fuzz_targets()
-    invalid_targets = [t for t in targets if t not in available_targets]
+    # Determine and validate targets before any other setup
+    targets = tuple(args.targets) if args.targets else FUZZ_TARGETS
+    invalid_targets = set(targets) - _FUZZ_TARGET_SET
     if invalid_targets:
-        logging.error(f"Invalid targets: {invalid_targets}")
-        logging.info(f"Available targets: {', '.join(available_targets)}")
+        logging.error(f"Invalid targets: {sorted(invalid_targets)}")
+        logging.info(f"Available targets: {', '.join(FUZZ_TARGETS)}")
         sys.exit(1)
     
+    # Private merge scratch space, removed when the runner exits
+    scratch_dir = None
+    if args.minimize:
+        try:
+            scratch_dir = scratch_root(args.scratch_dir)
+        except OSError as e:
+            parser.error(f"--scratch-dir {args.scratch_dir} is not usable: {e}")
+        atexit.register(shutil.rmtree, scratch_dir, ignore_errors=True)
+        logging.debug(f"Scratch directory: {scratch_dir}")
+    
+    # Resolve shared corpus groups
+    shared = {}
+    if args.shared_corpus or args.corpus_group:
+        try:
+            groups = (
+                parse_corpus_groups(args.corpus_group)
+                if args.corpus_group else CORPUS_GROUPS
+            )
+            shared = corpus_names(groups)
+        except ValueError as e:
+            logging.error(str(e))
+            sys.exit(1)
+    
     logging.info(f"Running {len(targets)} fuzz target(s): {', '.join(targets)}")
     
-    # Run targets
+    # Expand into (target, sanitizer) runs; "all" distributes the time
+    # budget across one build per sanitizer
+    sanitizers = SANITIZER_VARIANTS if args.sanitizer == "all" else (args.sanitizer,)
+    runs = [(target, sanitizer) for target in targets for sanitizer in sanitizers]
+    max_time = args.max_time
+    if max_time and len(sanitizers) > 1:
+        max_time = max(1, max_time // len(sanitizers))
+    
+    # Build once per sanitizer up front; the run loop only executes binaries
+    binaries = {}
+    try:
+        for sanitizer in sanitizers:
+            binaries[sanitizer] = build_all_targets(sanitizer, args.dispatch)
+    except RuntimeError as e:
+        logging.error(str(e))
+        sys.exit(1)
+    missing = [
+        run_label(target, sanitizer)
+        for target, sanitizer in runs
+        if target not in binaries[sanitizer]
+    ]
+    if missing:
+        logging.error(f"No built binary found for: {missing}")
+        sys.exit(1)
+    
+    # Minimize each corpus once, before any variant starts fuzzing it.
+    # Shared corpora are only deduplicated: merging against one target's
+    # coverage would drop seeds its siblings need.
+    if args.minimize:
+        for group in sorted({shared[t] for t in targets if t in shared}):
+            dedupe_corpus(args.corpus_dir / group)
+        for target in targets:
+            if target in shared:
+                continue
+            minimize_corpus(
+                target,
+                binaries[sanitizers[0]][target],
+                args.corpus_dir,
+                target_env(
+                    target, binaries[sanitizers[0]][target], sanitizers[0]
+                ),
+                args.drop_large,
+                scratch_dir,
+                sanitizers[0]
+            )
+    
+    # Coverage-directed seed selection, also skipped for shared corpora
+    if args.select_seeds:
+        for target in targets:
+            if target in shared:
+                continue
+            select_seeds(
+                target,
+                binaries[sanitizers[0]][target],
+                args.corpus_dir,
+                args.select_seeds,
+                target_env(
+                    target, binaries[sanitizers[0]][target], sanitizers[0]
+                ),
+                sanitizers[0]
+            )
+    
+    # Run targets, recording each run in the results log
+    results_path = args.results or args.corpus_dir / "results.jsonl"
+    results_path.parent.mkdir(parents=True, exist_ok=True)
+    results_path.write_text("")
     if args.parallel:
-        # Run in parallel
-        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
-            futures = {
-                executor.submit(
-                    run_fuzz_target,
-                    target,
-                    args.corpus_dir,
-                    args.max_time,
-                    args.max_runs,
-                    1,  # Single job per target when parallelizing
-                    args.sanitizer
-                ): target
-                for target in targets
-            }
-            
-            results = {}
-            for future in as_completed(futures):
-                target = futures[future]
-                try:
-                    success, output = future.result()
-                    results[target] = (success, output)
-                    if success:
-                        logging.info(f"✓ {target}: Completed successfully")
-                    else:
-                        logging.error(f"✗ {target}: Failed")
-                        logging.error(output[:500])  # First 500 chars
-                except Exception as e:
-                    logging.error(f"✗ {target}: Exception - {e}")
-                    results[target] = (False, str(e))
+        asyncio.run(run_all(
+            runs,
+            binaries,
+            args.corpus_dir,
+            max_time,
+            args.max_runs,
+            args.jobs,
+            results_path,
+            shared,
+            args.stall_threshold,
+            args.plateau_window,
+            args.plateau_delta
+        ))
     else:
         # Run sequentially
-        results = {}
-        for target in targets:
-            success, output = run_fuzz_target(
+        for target, sanitizer in runs:
+            record = run_fuzz_target(
                 target,
+                binaries[sanitizer][target],
                 args.corpus_dir,
-                args.max_time,
+                max_time,
                 args.max_runs,
                 args.jobs,
-                args.sanitizer
+                sanitizer,
+                corpus_name=shared.get(target),
+                stall_threshold=args.stall_threshold,
+                plateau_window=args.plateau_window,
+                plateau_delta=args.plateau_delta
             )
-            results[target] = (success, output)
-            if success:
-                logging.info(f"✓ {target}: Completed successfully")
-            else:
-                logging.error(f"✗ {target}: Failed")
-                logging.error(output[:500])
+            append_record(results_path, record)
+            report_result(record)
     
     # Summary
-    successful = sum(1 for success, _ in results.values() if success)
-    total = len(results)
+    successful = total = crashes = 0
+    with open(results_path) as f:
+        for line in f:
+            rec = json.loads(line)
+            total += 1
+            successful += bool(rec["ok"])
+            crashes += rec["crashes"]
     
     logging.info("=" * 60)
-    logging.info(f"Summary: {successful}/{total} targets completed successfully")
+    logging.info(f"Summary: {successful}/{total} runs completed successfully")
+    if crashes:
+        logging.info(f"Crash artifacts written: {crashes}")
+    logging.info(f"Results: {results_path}")
     
     if successful < total:
         sys.exit(1)
 
 if __name__ == "__main__":
     main()
-